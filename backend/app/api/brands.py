@@ -1,6 +1,7 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -40,6 +41,10 @@ def create_brand(brand: BrandCreate, db: Session = Depends(get_db)):
     """Create a new brand"""
     db_brand = Brand(**brand.model_dump())
     db.add(db_brand)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Brand already exists")
     db.refresh(db_brand)
     return db_brand
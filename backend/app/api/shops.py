@@ -1,14 +1,105 @@
+import base64
+import binascii
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 
 from ..database import get_db
-from ..models import Shop
+from ..models import Shop, shop_search_vector
 from ..schemas import ShopCreate, ShopListResponse, ShopResponse
+from ..services.geo import distance_from, equirectangular_from
 
 router = APIRouter()
 
+# Below this radius nearby search uses the flat-earth distance approximation
+EQUIRECTANGULAR_MAX_RADIUS_KM = 5
+
+# List pages at least this large are streamed instead of cached whole
+STREAM_MIN_PAGE_SIZE = 500
+STREAM_CHUNK_SIZE = 100
+
+# In-process cache of serialized list responses keyed by the normalized
+# filters. Writes through this API clear it; the TTL bounds staleness from
+# import scripts and other workers.
+LIST_CACHE_MAX_ENTRIES = 512
+LIST_CACHE_TTL_SECONDS = 60
+
+_list_cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+_list_cache_lock = threading.Lock()
+
+
+def clear_list_cache():
+    """Drop all cached /api/shops list responses"""
+    with _list_cache_lock:
+        _list_cache.clear()
+
+
+def _get_cached_list(key: tuple) -> Optional[str]:
+    with _list_cache_lock:
+        entry = _list_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at < time.monotonic():
+            del _list_cache[key]
+            return None
+        _list_cache.move_to_end(key)
+        return body
+
+
+def _set_cached_list(key: tuple, body: str):
+    with _list_cache_lock:
+        _list_cache[key] = (time.monotonic() + LIST_CACHE_TTL_SECONDS, body)
+        _list_cache.move_to_end(key)
+        while len(_list_cache) > LIST_CACHE_MAX_ENTRIES:
+            _list_cache.popitem(last=False)
+
+
+def _stream_shop_list(shops: list[Shop], **fields) -> StreamingResponse:
+    """
+    Stream a ShopListResponse body chunk by chunk, so a large page is never
+    held as one validated model and one full JSON string at the same time.
+    """
+
+    def generate():
+        yield '{"shops":['
+        for start in range(0, len(shops), STREAM_CHUNK_SIZE):
+            chunk = shops[start : start + STREAM_CHUNK_SIZE]
+            if start:
+                yield ","
+            yield ",".join(
+                ShopResponse.model_validate(shop).model_dump_json() for shop in chunk
+            )
+        # Remaining fields go after the array: '],"total":...}'
+        yield "]," + json.dumps(fields, separators=(",", ":"))[1:]
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+def _encode_cursor(shop_id: int) -> str:
+    """Encode the last-seen shop id as an opaque cursor"""
+    return base64.urlsafe_b64encode(str(shop_id).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by _encode_cursor"""
+    try:
+        shop_id = int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Out-of-range ids would overflow the database integer type
+    if not 0 <= shop_id < 2**63:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return shop_id
+
 
 @router.get("", response_model=ShopListResponse)
 def list_shops(
@@ -17,10 +108,24 @@ def list_shops(
     country: Optional[str] = None,
     city: Optional[str] = None,
     brand_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     db: Session = Depends(get_db),
 ):
-    """List all shops with pagination and filters"""
-    query = db.query(Shop)
+    """
+    List all shops with pagination and filters.
+
+    Pass the returned next_cursor back as ``cursor`` for keyset pagination,
+    which seeks past the last-seen id instead of scanning an OFFSET and
+    skips the COUNT query (total is null in cursor mode). Page mode can skip
+    the count too with include_total=false.
+    """
+    cache_key = (country, city, brand_id, page, page_size, cursor, include_total)
+    cached = _get_cached_list(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    query = db.query(Shop).options(joinedload(Shop.brand))
 
     if country:
         query = query.filter(Shop.country == country)
@@ -29,10 +134,51 @@ def list_shops(
     if brand_id:
         query = query.filter(Shop.brand_id == brand_id)
 
-    total = query.count()
-    shops = query.offset((page - 1) * page_size).limit(page_size).all()
+    query = query.order_by(Shop.id)
 
-    return ShopListResponse(shops=shops, total=total, page=page, page_size=page_size)
+    if cursor:
+        total = None
+        shops = query.filter(Shop.id > _decode_cursor(cursor)).limit(page_size).all()
+    elif not include_total:
+        total = None
+        shops = query.offset((page - 1) * page_size).limit(page_size).all()
+    else:
+        # The window count rides along with the page, saving a COUNT round trip
+        rows = (
+            query.add_columns(func.count().over().label("total"))
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+        shops = [row.Shop for row in rows]
+        if rows:
+            total = rows[0].total
+        else:
+            # Past the last page there is no row to carry the count
+            total = query.count() if page > 1 else 0
+
+    next_cursor = _encode_cursor(shops[-1].id) if len(shops) == page_size else None
+
+    if page_size >= STREAM_MIN_PAGE_SIZE:
+        return _stream_shop_list(
+            shops,
+            total=total,
+            page=page,
+            page_size=page_size,
+            next_cursor=next_cursor,
+        )
+
+    # Serialize once with pydantic-core and hand FastAPI the bytes, so neither
+    # this response nor later cache hits are re-validated and re-encoded
+    body = ShopListResponse(
+        shops=shops,
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
+    ).model_dump_json()
+    _set_cached_list(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/search", response_model=list[ShopResponse])
@@ -42,9 +188,26 @@ def search_shops(
     db: Session = Depends(get_db),
 ):
     """Search shops by name or address"""
+    if db.get_bind().dialect.name == "postgresql":
+        # Whole-word matches via the GIN index; substring ILIKE only on a miss
+        shops = (
+            db.query(Shop)
+            .options(joinedload(Shop.brand))
+            .filter(shop_search_vector.op("@@")(func.plainto_tsquery("simple", q)))
+            .limit(limit)
+            .all()
+        )
+        if shops:
+            return shops
+
     shops = (
         db.query(Shop)
-        .filter((Shop.name.ilike(f"%{q}%")) | (Shop.address.ilike(f"%{q}%")))
+        .options(joinedload(Shop.brand))
+        .filter(
+            # autoescape keeps a literal % or _ in q from matching every row
+            Shop.name.icontains(q, autoescape=True)
+            | Shop.address.icontains(q, autoescape=True)
+        )
         .limit(limit)
         .all()
     )
@@ -59,33 +222,53 @@ def nearby_shops(
     limit: int = Query(500, ge=1, le=500),
     db: Session = Depends(get_db),
 ):
-    """Find shops near a location (simple distance calculation)"""
-    import math
-
-    # Simple bounding box filter (not perfect sphere distance)
+    """Find shops within radius_km of a location, nearest first"""
+    # Cheap bounding box in SQL first, then exact great-circle distance on
+    # the few candidates left
     # 1 degree latitude ≈ 111km
     lat_delta = radius_km / 111
-    # 1 degree longitude varies by latitude: 111km * cos(lat)
-    cos_lat = math.cos(math.radians(lat)) if lat != 0 else 1
+    # 1 degree longitude varies by latitude: 111km * cos(lat); clamp near the
+    # poles so the box stays finite
+    cos_lat = max(math.cos(math.radians(lat)), 0.01)
     lng_delta = radius_km / (111 * cos_lat)
 
-    shops = (
-        db.query(Shop)
-        .filter(
-            Shop.latitude.between(lat - lat_delta, lat + lat_delta),
-            Shop.longitude.between(lng - lng_delta, lng + lng_delta),
-        )
-        .limit(limit)
-        .all()
+    # Only pull coordinates for the box; full rows are loaded for the hits
+    candidates = db.query(Shop.id, Shop.latitude, Shop.longitude).filter(
+        Shop.latitude.between(lat - lat_delta, lat + lat_delta),
+        Shop.longitude.between(lng - lng_delta, lng + lng_delta),
     )
 
-    return shops
+    if radius_km < EQUIRECTANGULAR_MAX_RADIUS_KM:
+        distance_to = equirectangular_from(lat, lng)
+    else:
+        distance_to = distance_from(lat, lng)
+    in_radius = []
+    for shop_id, shop_lat, shop_lng in candidates:
+        distance = distance_to(shop_lat, shop_lng)
+        if distance <= radius_km:
+            in_radius.append((distance, shop_id))
+    in_radius.sort()
+    nearest_ids = [shop_id for _, shop_id in in_radius[:limit]]
+    if not nearest_ids:
+        return []
+
+    hits = (
+        db.query(Shop).options(joinedload(Shop.brand)).filter(Shop.id.in_(nearest_ids))
+    )
+    shops_by_id = {shop.id: shop for shop in hits}
+    # A shop deleted between the two queries is simply left out
+    return [shops_by_id[shop_id] for shop_id in nearest_ids if shop_id in shops_by_id]
 
 
 @router.get("/{shop_id}", response_model=ShopResponse)
 def get_shop(shop_id: int, db: Session = Depends(get_db)):
     """Get a single shop by ID"""
-    shop = db.query(Shop).filter(Shop.id == shop_id).first()
+    shop = (
+        db.query(Shop)
+        .options(joinedload(Shop.brand))
+        .filter(Shop.id == shop_id)
+        .first()
+    )
     if not shop:
         raise HTTPException(status_code=404, detail="Shop not found")
     return shop
@@ -98,4 +281,5 @@ def create_shop(shop: ShopCreate, db: Session = Depends(get_db)):
     db.add(db_shop)
     db.commit()
     db.refresh(db_shop)
+    clear_list_cache()
     return db_shop
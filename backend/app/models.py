@@ -1,7 +1,19 @@
 import enum
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    literal_column,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from .database import Base
@@ -35,6 +47,17 @@ class Shop(Base):
     """Individual boba tea shop location"""
 
     __tablename__ = "shops"
+    __table_args__ = (
+        # Backs the bounding-box prefilter in /api/shops/nearby
+        Index("ix_shops_lat_lng", "latitude", "longitude"),
+        # Independent shops (no brand) never match a brand_id filter
+        Index(
+            "ix_shops_brand_id",
+            "brand_id",
+            postgresql_where=text("brand_id IS NOT NULL"),
+            sqlite_where=text("brand_id IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False)
@@ -42,8 +65,8 @@ class Shop(Base):
 
     # Location
     address = Column(String(500), nullable=False)
-    city = Column(String(100))
-    country = Column(String(50), nullable=False)  # 'TW' or 'US'
+    city = Column(String(100), index=True)
+    country = Column(String(50), nullable=False, index=True)  # 'TW' or 'US'
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
 
@@ -62,3 +85,20 @@ class Shop(Base):
     updated_at = Column(DateTime, default=datetime.now(UTC), onupdate=datetime.now(UTC))
 
     brand = relationship("Brand", back_populates="shops")
+
+
+# Full-text document for /api/shops/search. The query must use this exact
+# expression for PostgreSQL to pick the GIN index; SQLite skips the index.
+# Existing databases get this and the other Shop indexes from
+# scripts/create_shop_indexes.py, since create_all skips existing tables.
+shop_search_vector = func.to_tsvector(
+    literal_column("'simple'"),
+    func.coalesce(Shop.name, literal_column("''"))
+    + literal_column("' '")
+    + func.coalesce(Shop.address, literal_column("''")),
+)
+Shop.__table__.append_constraint(
+    Index("shops_fts", shop_search_vector, postgresql_using="gin").ddl_if(
+        dialect="postgresql"
+    )
+)
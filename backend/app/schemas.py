@@ -53,9 +53,11 @@ class ShopResponse(ShopBase):
 
 class ShopListResponse(BaseModel):
     shops: list[ShopResponse]
-    total: int
+    # None in cursor mode or when the request passes include_total=false
+    total: Optional[int] = None
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class FeedbackBase(BaseModel):
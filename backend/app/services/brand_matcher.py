@@ -93,6 +93,12 @@ BRAND_ALIASES = {
     "The Whale Tea": ["Whale Tea", "The Whale Tea", "大鯨魚"],
 }
 
+# Lowercased aliases, built once so matching doesn't re-lower them per shop
+_BRAND_ALIASES_LOWER = {
+    brand: [alias.lower() for alias in aliases]
+    for brand, aliases in BRAND_ALIASES.items()
+}
+
 
 def get_aliases_for_brand(brand_name: str) -> list[str]:
     """Get all aliases for a brand name."""
@@ -142,12 +148,13 @@ def match_brand_from_name(
         return 1.0
 
     # 3. Alias match
-    # Use provided aliases or lookup
-    check_aliases = (
-        aliases if aliases is not None else get_aliases_for_brand(brand_name)
-    )
+    # Use provided aliases or the pre-lowered lookup
+    if aliases is not None:
+        check_aliases = [alias.lower() for alias in aliases]
+    else:
+        check_aliases = _BRAND_ALIASES_LOWER.get(brand_name, [])
     for alias in check_aliases:
-        if alias.lower() in shop_lower:
+        if alias in shop_lower:
             return 1.0
 
     # 4. Fuzzy Matching using RapidFuzz
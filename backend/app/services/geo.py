@@ -0,0 +1,55 @@
+"""
+Geo helpers for distance-based shop lookups.
+"""
+
+import math
+from collections.abc import Callable
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def distance_from(lat: float, lng: float) -> Callable[[float, float], float]:
+    """
+    Return a function giving the great-circle distance in kilometers from
+    (lat, lng). The origin's radians and cosine are computed once, which
+    matters when scoring many candidates against the same point.
+    """
+    phi1 = math.radians(lat)
+    cos_phi1 = math.cos(phi1)
+
+    def distance_to(lat2: float, lng2: float) -> float:
+        dlng = lng2 - lng
+        if abs(dlng) < 1e-12:
+            # Same meridian: the arc is just the latitude difference
+            return EARTH_RADIUS_KM * abs(math.radians(lat2 - lat))
+
+        phi2 = math.radians(lat2)
+        a = (
+            math.sin((phi2 - phi1) / 2) ** 2
+            + cos_phi1 * math.cos(phi2) * math.sin(math.radians(dlng) / 2) ** 2
+        )
+        return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+    return distance_to
+
+
+def equirectangular_from(lat: float, lng: float) -> Callable[[float, float], float]:
+    """
+    Like distance_from, but treats the area around (lat, lng) as flat: one
+    hypot per point instead of the haversine trig. Within a few kilometers
+    it agrees with the great-circle distance to within meters.
+    """
+    km_per_degree = EARTH_RADIUS_KM * math.pi / 180
+    kx = km_per_degree * math.cos(math.radians(lat))
+
+    def distance_to(lat2: float, lng2: float) -> float:
+        # Wrap so points across the antimeridian stay close
+        dlng = (lng2 - lng + 180) % 360 - 180
+        return math.hypot(dlng * kx, (lat2 - lat) * km_per_degree)
+
+    return distance_to
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in kilometers between two lat/lng points."""
+    return distance_from(lat1, lng1)(lat2, lng2)
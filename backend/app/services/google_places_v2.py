@@ -274,7 +274,8 @@ class GooglePlacesServiceV2:
             country=country,
         )
 
-    def _parse_place(self, place: dict, country: str) -> dict:
+    @staticmethod
+    def _parse_place(place: dict, country: str) -> dict:
         """Parse Places API (New) response into our shop format."""
 
         # Extract location
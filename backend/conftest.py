@@ -3,69 +3,161 @@ Pytest fixtures for Boba Seeker backend tests.
 Provides test database, sessions, sample data, and mock utilities.
 """
 
+import os
 from datetime import datetime, timezone
 
-import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+# Keep the app's own engine in memory too, so pytest-xdist workers never share
+# (and race on) the default ./boba_seeker.db file. Must be set before app import.
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 
-from app.database import Base, get_db
-from app.models import Brand, Shop
-from main import app
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, event, select  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.api.shops import clear_list_cache  # noqa: E402
+from app.database import Base, get_db  # noqa: E402
+from app.models import Brand, Shop  # noqa: E402
+from main import app  # noqa: E402
 
 # ============================================================================
 # Database Fixtures
 # ============================================================================
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_engine():
-    """Create an in-memory SQLite engine for testing."""
+    """
+    Create an in-memory SQLite engine once and build the schema once.
+    Each pytest-xdist worker is its own process, so each gets its own database.
+    """
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # pysqlite emits BEGIN lazily and mishandles SAVEPOINT; take over so the
+    # per-test outer transaction and its savepoints behave like PostgreSQL
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
     yield engine
-    Base.metadata.drop_all(bind=engine)
+    # Per-test data is rolled back by test_connection, so no DROP/DELETE pass
+    # is needed; the in-memory database goes away with its only connection
+    engine.dispose()
+
+
+@pytest.fixture(scope="class")
+def class_connection(test_engine):
+    """
+    Open a connection whose outer transaction is rolled back after each test
+    class, so class-scoped sample data is inserted once and then discarded.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="class")
+def class_db(class_connection):
+    """Session for class-scoped fixtures; tests should use test_db."""
+    db = Session(bind=class_connection, join_transaction_mode="create_savepoint")
+    try:
+        yield db
+    finally:
+        db.close()
 
 
 @pytest.fixture(scope="function")
-def test_db(test_engine):
-    """Create a test database session."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False, autoflush=False, bind=test_engine
+def test_connection(class_connection):
+    """Wrap each test in a SAVEPOINT on the class connection, rolled back after."""
+    savepoint = class_connection.begin_nested()
+    try:
+        yield class_connection
+    finally:
+        if savepoint.is_active:
+            savepoint.rollback()
+
+
+@pytest.fixture(scope="function")
+def test_session_factory(test_connection):
+    """
+    Session factory bound to the test connection.
+    Sessions run inside SAVEPOINTs, so their commit()/rollback() never end the
+    outer transaction.
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=test_connection,
+        join_transaction_mode="create_savepoint",
     )
-    db = TestingSessionLocal()
+
+
+@pytest.fixture(scope="function")
+def test_db(test_session_factory):
+    """Create a test database session."""
+    db = test_session_factory()
     try:
         yield db
     finally:
         db.close()
 
 
+@pytest.fixture(scope="session")
+def app_client():
+    """Create one FastAPI test client (and app startup) for the whole session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """
+    Async HTTP client that calls the app in-process over ASGI.
+    ASGITransport doesn't send lifespan events, so run the app's startup and
+    shutdown here, once for the whole session.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as async_client:
+            yield async_client
+
+
 @pytest.fixture(scope="function")
-def client(test_engine, test_db):
-    """Create a FastAPI test client with test database."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False, autoflush=False, bind=test_engine
-    )
+def client(app_client, test_session_factory):
+    """Shared FastAPI test client wired to this test's database transaction."""
 
     def override_get_db():
-        db = TestingSessionLocal()
+        db = test_session_factory()
         try:
             yield db
         finally:
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
-
-    with TestClient(app) as test_client:
-        yield test_client
-
-    app.dependency_overrides.clear()
+    # Cached list responses would outlive the rolled-back data of other tests
+    clear_list_cache()
+    try:
+        yield app_client
+    finally:
+        app.dependency_overrides.clear()
 
 
 # ============================================================================
@@ -74,8 +166,31 @@ def client(test_engine, test_db):
 
 
 @pytest.fixture
-def sample_brand(test_db) -> Brand:
-    """Create a sample brand for testing."""
+def shop_factory(test_db):
+    """
+    Build a Shop with valid defaults, add it to the session and return it.
+    Keyword arguments override the defaults (pass None to leave a field NULL).
+    """
+
+    def make_shop(**overrides) -> Shop:
+        fields = {
+            "name": "Test Shop",
+            "address": "123 Test St",
+            "country": "US",
+            "latitude": 37.7749,
+            "longitude": -122.4194,
+        }
+        fields.update(overrides)
+        shop = Shop(**fields)
+        test_db.add(shop)
+        return shop
+
+    return make_shop
+
+
+@pytest.fixture(scope="class")
+def sample_brand(class_db) -> Brand:
+    """Create a sample brand once per test class (read-only in tests)."""
     brand = Brand(
         name="Test Boba",
         name_zh="測試珍珠",
@@ -83,49 +198,60 @@ def sample_brand(test_db) -> Brand:
         origin_country="TW",
         website="https://testboba.example.com",
     )
-    test_db.add(brand)
-    test_db.commit()
-    test_db.refresh(brand)
+    class_db.add(brand)
+    class_db.flush()
     return brand
 
 
-@pytest.fixture
-def sample_brands(test_db) -> list[Brand]:
-    """Create multiple sample brands for testing."""
-    brands = [
-        Brand(
-            name="Gong Cha",
-            name_zh="貢茶",
-            description="International boba chain",
-            origin_country="TW",
-        ),
-        Brand(
-            name="Tiger Sugar",
-            name_zh="老虎堂",
-            description="Famous for brown sugar boba",
-            origin_country="TW",
-        ),
-        Brand(
-            name="Boba Guys",
-            name_zh="Boba Guys",
-            description="SF-based artisan boba",
-            origin_country="US",
-        ),
-    ]
-    for brand in brands:
-        test_db.add(brand)
-    test_db.commit()
-    for brand in brands:
-        test_db.refresh(brand)
-    return brands
+SAMPLE_BRAND_ROWS = [
+    {
+        "name": "Gong Cha",
+        "name_zh": "貢茶",
+        "description": "International boba chain",
+        "origin_country": "TW",
+    },
+    {
+        "name": "Tiger Sugar",
+        "name_zh": "老虎堂",
+        "description": "Famous for brown sugar boba",
+        "origin_country": "TW",
+    },
+    {
+        "name": "Boba Guys",
+        "name_zh": "Boba Guys",
+        "description": "SF-based artisan boba",
+        "origin_country": "US",
+    },
+]
 
 
 @pytest.fixture
-def sample_shop(test_db, sample_brand) -> Shop:
-    """Create a sample shop for testing."""
+def sample_brands(test_db) -> list[Brand]:
+    """Create multiple sample brands for testing (one batched INSERT)."""
+    # Bulk operations execute immediately; no commit or flush is needed
+    test_db.bulk_insert_mappings(Brand, SAMPLE_BRAND_ROWS)
+    names = [row["name"] for row in SAMPLE_BRAND_ROWS]
+    return test_db.scalars(
+        select(Brand).where(Brand.name.in_(names)).order_by(Brand.id)
+    ).all()
+
+
+@pytest.fixture(scope="class")
+def sample_brand_and_shop(class_db) -> tuple[Brand, Shop]:
+    """
+    Create a sample brand and one of its shops with a single flush, once per
+    test class (read-only in tests).
+    """
+    brand = Brand(
+        name="Test Boba Chain",
+        name_zh="測試奶茶",
+        description="A test boba chain",
+        origin_country="TW",
+        website="https://testbobachain.example.com",
+    )
     shop = Shop(
         name="Test Shop Downtown",
-        brand_id=sample_brand.id,
+        brand=brand,
         address="123 Test Street, San Francisco, CA 94102",
         city="San Francisco",
         country="US",
@@ -138,70 +264,90 @@ def sample_shop(test_db, sample_brand) -> Shop:
         last_verified=datetime.now(timezone.utc),
         created_at=datetime.now(timezone.utc),
     )
-    test_db.add(shop)
-    test_db.commit()
-    test_db.refresh(shop)
-    return shop
+    class_db.add_all([brand, shop])
+    class_db.flush()
+    return brand, shop
+
+
+@pytest.fixture(scope="class")
+def sample_shop(sample_brand_and_shop) -> Shop:
+    """Create a sample shop for testing."""
+    return sample_brand_and_shop[1]
+
+
+# Built once at import; (brand name, row) pairs resolved to brand ids per test
+SAMPLE_SHOP_ROWS = [
+    # San Francisco shops
+    (
+        "Gong Cha",
+        {
+            "name": "Gong Cha SF Downtown",
+            "address": "100 Market St, San Francisco, CA",
+            "city": "San Francisco",
+            "country": "US",
+            "latitude": 37.7749,
+            "longitude": -122.4194,
+            "google_place_id": "gongcha_sf_1",
+            "status": "active",
+        },
+    ),
+    (
+        "Tiger Sugar",
+        {
+            "name": "Tiger Sugar SF",
+            "address": "200 Powell St, San Francisco, CA",
+            "city": "San Francisco",
+            "country": "US",
+            "latitude": 37.7855,
+            "longitude": -122.4079,
+            "google_place_id": "tigersugar_sf_1",
+            "status": "active",
+        },
+    ),
+    # Taipei shops
+    (
+        "Gong Cha",
+        {
+            "name": "貢茶 台北店",
+            "address": "台北市信義區松高路",
+            "city": "Taipei",
+            "country": "TW",
+            "latitude": 25.0330,
+            "longitude": 121.5654,
+            "google_place_id": "gongcha_tw_1",
+            "status": "active",
+        },
+    ),
+    # Oakland shop (different city, near SF)
+    (
+        "Boba Guys",
+        {
+            "name": "Boba Guys Oakland",
+            "address": "300 Broadway, Oakland, CA",
+            "city": "Oakland",
+            "country": "US",
+            "latitude": 37.8044,
+            "longitude": -122.2712,
+            "google_place_id": "bobaguys_oak_1",
+            "status": "active",
+        },
+    ),
+]
 
 
 @pytest.fixture
 def sample_shops(test_db, sample_brands) -> list[Shop]:
-    """Create multiple sample shops for testing."""
-    shops = [
-        # San Francisco shops
-        Shop(
-            name="Gong Cha SF Downtown",
-            brand_id=sample_brands[0].id,
-            address="100 Market St, San Francisco, CA",
-            city="San Francisco",
-            country="US",
-            latitude=37.7749,
-            longitude=-122.4194,
-            google_place_id="gongcha_sf_1",
-            status="active",
-        ),
-        Shop(
-            name="Tiger Sugar SF",
-            brand_id=sample_brands[1].id,
-            address="200 Powell St, San Francisco, CA",
-            city="San Francisco",
-            country="US",
-            latitude=37.7855,
-            longitude=-122.4079,
-            google_place_id="tigersugar_sf_1",
-            status="active",
-        ),
-        # Taipei shops
-        Shop(
-            name="貢茶 台北店",
-            brand_id=sample_brands[0].id,
-            address="台北市信義區松高路",
-            city="Taipei",
-            country="TW",
-            latitude=25.0330,
-            longitude=121.5654,
-            google_place_id="gongcha_tw_1",
-            status="active",
-        ),
-        # Oakland shop (different city, near SF)
-        Shop(
-            name="Boba Guys Oakland",
-            brand_id=sample_brands[2].id,
-            address="300 Broadway, Oakland, CA",
-            city="Oakland",
-            country="US",
-            latitude=37.8044,
-            longitude=-122.2712,
-            google_place_id="bobaguys_oak_1",
-            status="active",
-        ),
+    """Create multiple sample shops for testing (one batched INSERT)."""
+    brand_ids = {brand.name: brand.id for brand in sample_brands}
+    shop_rows = [
+        {**row, "brand_id": brand_ids[brand_name]}
+        for brand_name, row in SAMPLE_SHOP_ROWS
     ]
-    for shop in shops:
-        test_db.add(shop)
-    test_db.commit()
-    for shop in shops:
-        test_db.refresh(shop)
-    return shops
+    test_db.bulk_insert_mappings(Shop, shop_rows)
+    place_ids = [row["google_place_id"] for row in shop_rows]
+    return test_db.scalars(
+        select(Shop).where(Shop.google_place_id.in_(place_ids)).order_by(Shop.id)
+    ).all()
 
 
 # ============================================================================
@@ -209,44 +355,53 @@ def sample_shops(test_db, sample_brands) -> list[Shop]:
 # ============================================================================
 
 
+# Built once at import; fixtures hand out the shared dicts, so tests must not
+# mutate them
+MOCK_PLACES_RESPONSE = {
+    "places": [
+        {
+            "id": "ChIJ_mock_place_id_1",
+            "displayName": {"text": "Gong Cha", "languageCode": "en"},
+            "formattedAddress": "123 Main St, San Francisco, CA 94102, USA",
+            "location": {"latitude": 37.7749, "longitude": -122.4194},
+            "googleMapsUri": "https://maps.google.com/?cid=123456789",
+            "types": ["cafe", "bubble_tea_store"],
+        },
+        {
+            "id": "ChIJ_mock_place_id_2",
+            "displayName": {"text": "Tiger Sugar SF", "languageCode": "en"},
+            "formattedAddress": "456 Market St, San Francisco, CA 94103, USA",
+            "location": {"latitude": 37.7855, "longitude": -122.4079},
+            "googleMapsUri": "https://maps.google.com/?cid=987654321",
+            "types": ["restaurant", "bubble_tea_store"],
+        },
+    ]
+}
+
+MOCK_PLACES_EMPTY_RESPONSE = {"places": []}
+
+MOCK_PLACES_ERROR_RESPONSE = {
+    "error": {
+        "code": 400,
+        "message": "Invalid request",
+        "status": "INVALID_ARGUMENT",
+    }
+}
+
+
 @pytest.fixture
 def mock_places_response():
     """Sample Google Places API (New) response."""
-    return {
-        "places": [
-            {
-                "id": "ChIJ_mock_place_id_1",
-                "displayName": {"text": "Gong Cha", "languageCode": "en"},
-                "formattedAddress": "123 Main St, San Francisco, CA 94102, USA",
-                "location": {"latitude": 37.7749, "longitude": -122.4194},
-                "googleMapsUri": "https://maps.google.com/?cid=123456789",
-                "types": ["cafe", "bubble_tea_store"],
-            },
-            {
-                "id": "ChIJ_mock_place_id_2",
-                "displayName": {"text": "Tiger Sugar SF", "languageCode": "en"},
-                "formattedAddress": "456 Market St, San Francisco, CA 94103, USA",
-                "location": {"latitude": 37.7855, "longitude": -122.4079},
-                "googleMapsUri": "https://maps.google.com/?cid=987654321",
-                "types": ["restaurant", "bubble_tea_store"],
-            },
-        ]
-    }
+    return MOCK_PLACES_RESPONSE
 
 
 @pytest.fixture
 def mock_places_empty_response():
     """Empty Google Places API response."""
-    return {"places": []}
+    return MOCK_PLACES_EMPTY_RESPONSE
 
 
 @pytest.fixture
 def mock_places_error_response():
     """Google Places API error response."""
-    return {
-        "error": {
-            "code": 400,
-            "message": "Invalid request",
-            "status": "INVALID_ARGUMENT",
-        }
-    }
+    return MOCK_PLACES_ERROR_RESPONSE
@@ -199,14 +199,6 @@ def get_or_create_brand(db, brand_data: dict) -> Brand:
     return brand
 
 
-def shop_exists(db, google_place_id: str) -> bool:
-    """Check if shop already exists by Google Place ID."""
-    return (
-        db.query(Shop).filter(Shop.google_place_id == google_place_id).first()
-        is not None
-    )
-
-
 def extract_area(lat: float, lng: float) -> str:
     """Estimate area from coordinates."""
     if lng > 103.9:
@@ -379,6 +371,7 @@ async def import_brand_grid(
     imported = 0
     skipped_dup = 0
     skipped_name = 0
+    pending_shops: list[Shop] = []
 
     for point in grid_points:
         print(f"    📍 {point['name']} ({point['lat']:.4f}, {point['lng']:.4f})")
@@ -402,17 +395,11 @@ async def import_brand_grid(
             if not place_id:
                 continue
 
-            # Skip if already added this session
+            # Skip if already in database or added this session
             if place_id in session_place_ids:
                 skipped_dup += 1
                 continue
 
-            # Skip if already in database
-            if shop_exists(db, place_id):
-                session_place_ids.add(place_id)
-                skipped_dup += 1
-                continue
-
             # Verify brand name matches
             shop_name = shop_data.get("name", "")
             # brand.name matches name in brand_data
@@ -449,7 +436,7 @@ async def import_brand_grid(
                 last_verified=datetime.utcnow(),
                 created_at=datetime.utcnow(),
             )
-            db.add(shop)
+            pending_shops.append(shop)
             imported += 1
             point_imported += 1
 
@@ -459,6 +446,10 @@ async def import_brand_grid(
         # Small delay to avoid rate limits
         await asyncio.sleep(0.3)
 
+    # Insert the brand's new shops in one batch; the caller commits
+    if pending_shops:
+        db.bulk_save_objects(pending_shops)
+
     print(
         f"    📊 Total: +{imported} new, {skipped_dup} duplicates, "
         f"{skipped_name} non-matching"
@@ -524,8 +515,14 @@ async def main():
 
         # Pre-load existing place IDs
         print("📥 Loading existing place IDs...")
-        existing_ids = db.query(Shop.google_place_id).all()
-        session_place_ids = set(id[0] for id in existing_ids if id[0])
+        # This set is the only duplicate check during the import, so every
+        # existing place ID must be loaded up front
+        session_place_ids = {
+            place_id
+            for (place_id,) in db.query(Shop.google_place_id).filter(
+                Shop.google_place_id.isnot(None)
+            )
+        }
         print(f"   Loaded {len(session_place_ids)} existing place IDs")
 
         brands_to_import = BRANDS
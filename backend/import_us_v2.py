@@ -523,13 +523,6 @@ def get_or_create_brand(db, brand_data: dict) -> "Brand":
     return brand
 
 
-def shop_exists(db, google_place_id: str) -> bool:
-    return (
-        db.query(Shop).filter(Shop.google_place_id == google_place_id).first()
-        is not None
-    )
-
-
 async def import_brands_for_city(
     service: GooglePlacesServiceV2,
     db,
@@ -548,7 +541,7 @@ async def import_brands_for_city(
     total = 0
     for brand_data in brands:
         brand = get_or_create_brand(db, brand_data)
-        brand_count = 0
+        pending_shops: list[Shop] = []
 
         for point in grid:
             try:
@@ -567,9 +560,6 @@ async def import_brands_for_city(
                 place_id = shop_data.get("google_place_id")
                 if not place_id or place_id in session_place_ids:
                     continue
-                if shop_exists(db, place_id):
-                    session_place_ids.add(place_id)
-                    continue
 
                 # Verify shop matches brand
                 shop_name = shop_data.get("name", "")
@@ -587,7 +577,7 @@ async def import_brands_for_city(
                     continue
 
                 session_place_ids.add(place_id)
-                db.add(
+                pending_shops.append(
                     Shop(
                         name=shop_name,
                         brand_id=brand.id,
@@ -602,11 +592,13 @@ async def import_brands_for_city(
                         created_at=datetime.now(timezone.utc),
                     )
                 )
-                brand_count += 1
 
             await asyncio.sleep(0.25)
 
+        # Insert the brand's new shops in one batch
+        brand_count = len(pending_shops)
         if brand_count > 0:
+            db.bulk_save_objects(pending_shops)
             db.commit()
             logger.info(f"{brand.name}: +{brand_count} shops found in {city}")
             total += brand_count
@@ -632,6 +624,7 @@ async def discovery_search(
 
     logger.info(f"Discovery mode: searching 'boba tea' at {len(grid)} points in {city}")
 
+    pending_shops: list[Shop] = []
     discovered = 0
     linked = 0
 
@@ -652,9 +645,6 @@ async def discovery_search(
             place_id = shop_data.get("google_place_id")
             if not place_id or place_id in session_place_ids:
                 continue
-            if shop_exists(db, place_id):
-                session_place_ids.add(place_id)
-                continue
 
             shop_name = shop_data.get("name", "")
 
@@ -706,7 +696,7 @@ async def discovery_search(
                 last_verified=datetime.now(timezone.utc),
                 created_at=datetime.now(timezone.utc),
             )
-            db.add(shop)
+            pending_shops.append(shop)
             discovered += 1
 
             if matched_brand:
@@ -717,6 +707,9 @@ async def discovery_search(
 
         await asyncio.sleep(0.25)
 
+    # Insert all discovered shops in one batch
+    if pending_shops:
+        db.bulk_save_objects(pending_shops)
     db.commit()
     logger.info(
         f"Discovery result for {city}: {discovered} total, {linked} linked to brands"
@@ -746,7 +739,7 @@ async def import_city(
 
 def sync_to_database(target_url: str):
     """Sync all US shops to production with optimized bulk checks."""
-    from sqlalchemy import create_engine, text
+    from sqlalchemy import create_engine, insert, text
     from sqlalchemy.orm import sessionmaker
 
     if target_url.startswith("postgres://"):
@@ -771,22 +764,27 @@ def sync_to_database(target_url: str):
         brand_map_by_name = {b.name: b.id for b in target_brands}
         brand_id_map = {}  # Maps local_id -> target_id
 
-        brands_added = 0
+        # Create all missing brands in one INSERT ... RETURNING round-trip
+        # instead of a flush per brand to learn each new ID
+        new_brands = [
+            {
+                "name": b.name,
+                "name_zh": b.name_zh,
+                "description": b.description,
+                "origin_country": b.origin_country,
+            }
+            for b in local_brands
+            if b.name not in brand_map_by_name
+        ]
+        brands_added = len(new_brands)
+        if new_brands:
+            result = target_db.execute(
+                insert(Brand).values(new_brands).returning(Brand.id, Brand.name)
+            )
+            brand_map_by_name.update({name: brand_id for brand_id, name in result})
+
         for b in local_brands:
-            if b.name in brand_map_by_name:
-                brand_id_map[b.id] = brand_map_by_name[b.name]
-            else:
-                new = Brand(
-                    name=b.name,
-                    name_zh=b.name_zh,
-                    description=b.description,
-                    origin_country=b.origin_country,
-                )
-                target_db.add(new)
-                target_db.flush()  # Get the new ID
-                brand_id_map[b.id] = new.id
-                brand_map_by_name[b.name] = new.id
-                brands_added += 1
+            brand_id_map[b.id] = brand_map_by_name[b.name]
 
         target_db.commit()
         if brands_added:
@@ -801,33 +799,33 @@ def sync_to_database(target_url: str):
             .all()
         }
 
-        added = 0
+        new_shops = []
         skipped = 0
         for s in us_shops:
             if s.google_place_id and s.google_place_id in existing_target_ids:
                 skipped += 1
                 continue
 
-            target_db.add(
-                Shop(
-                    name=s.name,
-                    brand_id=brand_id_map.get(s.brand_id),
-                    address=s.address,
-                    city=s.city,
-                    country=s.country,
-                    latitude=s.latitude,
-                    longitude=s.longitude,
-                    google_place_id=s.google_place_id,
-                    status=s.status,
-                    last_verified=s.last_verified,
-                    created_at=s.created_at,
-                )
+            new_shops.append(
+                {
+                    "name": s.name,
+                    "brand_id": brand_id_map.get(s.brand_id),
+                    "address": s.address,
+                    "city": s.city,
+                    "country": s.country,
+                    "latitude": s.latitude,
+                    "longitude": s.longitude,
+                    "google_place_id": s.google_place_id,
+                    "status": s.status,
+                    "last_verified": s.last_verified,
+                    "created_at": s.created_at,
+                }
             )
-            added += 1
 
-            # Commit in batches for very large imports
-            if added % 100 == 0:
-                target_db.flush()
+        # Insert every new shop in a single executemany, brand IDs pre-filled
+        added = len(new_shops)
+        if new_shops:
+            target_db.execute(insert(Shop), new_shops)
 
         target_db.commit()
         print(f"✅ Sync complete: {added} added, {skipped} skipped.")
@@ -887,8 +885,14 @@ async def main():
     db = SessionLocal()
 
     try:
-        existing = db.query(Shop.google_place_id).all()
-        session_place_ids = set(id[0] for id in existing if id[0])
+        # This set is the only duplicate check during the import, so every
+        # existing place ID must be loaded up front
+        session_place_ids = {
+            place_id
+            for (place_id,) in db.query(Shop.google_place_id).filter(
+                Shop.google_place_id.isnot(None)
+            )
+        }
         print(f"📥 Loaded {len(session_place_ids)} existing place IDs\n")
 
         cities = [args.city] if args.city else list(CITY_GRIDS.keys())
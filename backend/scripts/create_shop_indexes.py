@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Create the shops table indexes declared on the model in an existing database.
+Base.metadata.create_all only adds indexes when it creates the table, so run
+this once after deploying model index changes. Safe to re-run: indexes that
+already exist are skipped, and PostgreSQL-only ones are skipped elsewhere.
+"""
+
+import os
+import sys
+
+from dotenv import load_dotenv
+from sqlalchemy import inspect
+
+# Load env
+env_path = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), ".env"
+)
+load_dotenv(env_path)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.database import engine  # noqa: E402
+from app.models import Shop  # noqa: E402
+
+
+def create_shop_indexes(bind) -> list[str]:
+    """Create any missing Shop indexes; returns the names created."""
+    created = []
+    with bind.begin() as conn:
+        existing = {index["name"] for index in inspect(conn).get_indexes("shops")}
+        for index in sorted(Shop.__table__.indexes, key=lambda ix: ix.name):
+            if index.name in existing:
+                print(f"⏭️  {index.name} already exists")
+                continue
+            # Respects ddl_if, so PostgreSQL-only indexes are skipped on SQLite
+            index.create(bind=conn, checkfirst=True)
+            if index.name in {ix["name"] for ix in inspect(conn).get_indexes("shops")}:
+                print(f"✅ Created {index.name}")
+                created.append(index.name)
+            else:
+                print(f"⏭️  {index.name} not supported on {conn.dialect.name}")
+    return created
+
+
+def main():
+    print(f"Database: {engine.url.render_as_string(hide_password=True)}")
+    created = create_shop_indexes(engine)
+    print(f"📊 Done: {len(created)} index(es) created")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,13 +25,24 @@ from typing import Dict
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from dotenv import dotenv_values
-from sqlalchemy import create_engine, text
+from sqlalchemy import column, create_engine, insert, select, table, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 
 # Import models to ensure they are registered
 from app.models import Brand, Shop
 
+# Columns to sync (exclude id) and the subset updated on conflict (exclude the
+# match key). These are fixed by the models, so build them once.
+BRAND_COLUMNS = tuple(c.name for c in Brand.__table__.columns if c.name != "id")
+BRAND_UPDATE_COLUMNS = tuple(c for c in BRAND_COLUMNS if c != "name")
+SHOP_COLUMNS = tuple(c.name for c in Shop.__table__.columns if c.name != "id")
+SHOP_UPDATE_COLUMNS = tuple(c for c in SHOP_COLUMNS if c != "google_place_id")
+
+# Index-free temp table that brands are loaded into before the final upsert
+BRANDS_STAGING = table("brands_staging", *(column(c) for c in BRAND_COLUMNS))
+
 
 def get_db_url(env_file_name: str) -> str:
     """Extract DATABASE_URL from an env file without loading it into os.environ."""
@@ -42,8 +53,20 @@ def get_db_url(env_file_name: str) -> str:
         print(f"⚠️ Warning: Env file not found at {env_path}")
         return None
 
-    config = dotenv_values(env_path)
-    url = config.get("DATABASE_URL")
+    # Fast path: scan for a plain DATABASE_URL=... line
+    url = None
+    prefix = "DATABASE_URL="
+    with open(env_path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(prefix):
+                value = line[len(prefix) :].strip().strip("\"'")
+                # Leave comments, interpolation, etc. to the full parser
+                if value and not any(ch in value for ch in " #$"):
+                    url = value
+                break
+
+    if not url:
+        url = dotenv_values(env_path).get("DATABASE_URL")
 
     if not url:
         return None
@@ -54,6 +77,28 @@ def get_db_url(env_file_name: str) -> str:
     return url
 
 
+def create_sync_engine(url: str):
+    """Create an engine that keeps warm, health-checked pooled connections."""
+    engine_kwargs = {"pool_size": 10, "max_overflow": 10, "pool_pre_ping": True}
+
+    # psycopg2 only: batch executemany() calls into multi-row INSERTs
+    if make_url(url).get_driver_name() == "psycopg2":
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
+
+    return create_engine(url, **engine_kwargs)
+
+
+def begin_bulk_load(target_session):
+    """
+    Tune the current target transaction for bulk upserts.
+    Settings are SET LOCAL, so they reset when the transaction commits.
+    """
+    # Skip the WAL flush wait on commit; a crash only loses a re-runnable sync
+    target_session.execute(text("SET LOCAL synchronous_commit = off"))
+    # Give the ON CONFLICT sort/hash more memory
+    target_session.execute(text("SET LOCAL work_mem = '256MB'"))
+
+
 def sync_brands(source_session, target_session, dry_run=False) -> Dict[int, int]:
     """
     Sync Brands by NAME.
@@ -66,13 +111,10 @@ def sync_brands(source_session, target_session, dry_run=False) -> Dict[int, int]
         print("   No brands in source.")
         return {}
 
-    # columns to sync (exclude id)
-    columns = [c.name for c in Brand.__table__.columns if c.name != "id"]
-
     # Batch upsert
     data_to_insert = []
     for b in source_brands:
-        row = {col: getattr(b, col) for col in columns}
+        row = {col: getattr(b, col) for col in BRAND_COLUMNS}
         data_to_insert.append(row)
 
     if dry_run:
@@ -80,11 +122,23 @@ def sync_brands(source_session, target_session, dry_run=False) -> Dict[int, int]
         # Return dummy map for dry run
         return {b.id: b.id for b in source_brands}
 
+    begin_bulk_load(target_session)
+
+    # Load into a staging table without indexes, so only the final upsert
+    # touches the unique index on brands.name
+    target_session.execute(
+        text(
+            "CREATE TEMP TABLE brands_staging ON COMMIT DROP AS "
+            f"SELECT {', '.join(BRAND_COLUMNS)} FROM brands WITH NO DATA"
+        )
+    )
+    target_session.execute(insert(BRANDS_STAGING), data_to_insert)
+
     # Perform Upsert
-    stmt = pg_insert(Brand).values(data_to_insert)
+    stmt = pg_insert(Brand).from_select(BRAND_COLUMNS, select(*BRANDS_STAGING.columns))
 
     # Update all columns except name (key) and id (pk)
-    update_dict = {col: stmt.excluded[col] for col in columns if col != "name"}
+    update_dict = {col: stmt.excluded[col] for col in BRAND_UPDATE_COLUMNS}
 
     upsert_stmt = stmt.on_conflict_do_update(
         index_elements=["name"],  # Match on Name
@@ -117,6 +171,7 @@ def sync_shops(
     """
     Sync Shops by GOOGLE_PLACE_ID.
     Rewrite brand_id using the provided map.
+    Leaves the transaction open; update_sequences() commits it.
     """
     print("\n📦 Syncing Table: Shops (Match by Google Place ID)")
 
@@ -128,18 +183,28 @@ def sync_shops(
     if total_rows == 0:
         return
 
-    # columns to sync (exclude id)
-    columns = [c.name for c in Shop.__table__.columns if c.name != "id"]
-
     batch_size = 1000
     processed = 0
 
+    # Build the upsert once; each batch is passed as executemany parameters
+    stmt = pg_insert(Shop)
+
+    # Update all columns except google_place_id (key) and id (pk)
+    update_dict = {col: stmt.excluded[col] for col in SHOP_UPDATE_COLUMNS}
+
+    upsert_stmt = stmt.on_conflict_do_update(
+        index_elements=["google_place_id"], set_=update_dict
+    )
+
+    if not dry_run:
+        begin_bulk_load(target_session)
+
     for offset in range(0, total_rows, batch_size):
         batch = query.offset(offset).limit(batch_size).all()
         data_to_insert = []
 
         for obj in batch:
-            row = {col: getattr(obj, col) for col in columns}
+            row = {col: getattr(obj, col) for col in SHOP_COLUMNS}
 
             # Key Step: TRANSLATE BRAND ID
             if row.get("brand_id"):
@@ -163,43 +228,31 @@ def sync_shops(
             continue
 
         # Perform Upsert
-        stmt = pg_insert(Shop).values(data_to_insert)
-
-        # Update all columns except google_place_id (key) and id (pk)
-        update_dict = {
-            col: stmt.excluded[col] for col in columns if col != "google_place_id"
-        }
-
-        upsert_stmt = stmt.on_conflict_do_update(
-            index_elements=["google_place_id"], set_=update_dict
-        )
-
-        target_session.execute(upsert_stmt)
-        target_session.commit()
+        target_session.execute(upsert_stmt, data_to_insert)
 
         processed += len(data_to_insert)
         print(f"   Progress: {processed}/{total_rows}")
 
 
 def update_sequences(target_session):
-    """Update PostgreSQL sequences to match the highest ID."""
+    """
+    Update PostgreSQL sequences to match the highest ID, then commit.
+    Runs in the shop sync's open transaction, so one COMMIT covers both.
+    """
     print("\n🔧 Updating sequences...")
     tables = ["brands", "shops"]
 
-    for table in tables:
-        try:
-            target_session.execute(
-                text(
-                    f"SELECT setval('{table}_id_seq', "
-                    f"COALESCE((SELECT MAX(id) FROM {table}), 1), true)"
-                )
-            )
-            print(f"   Updated sequence for {table}")
-        except Exception as e:
-            print(f"   ⚠️ Could not update sequence for {table}: {e}")
-            target_session.rollback()
+    # Bump every sequence in a single SELECT (one round-trip). setval() is
+    # strict, so a table without a serial sequence is a no-op, not an error.
+    setvals = ", ".join(
+        f"setval(pg_get_serial_sequence('{table_name}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {table_name}), 1), true)"
+        for table_name in tables
+    )
 
+    target_session.execute(text(f"SELECT {setvals}"))
     target_session.commit()
+    print(f"   Updated sequences for {', '.join(tables)}")
 
 
 def main():
@@ -229,8 +282,8 @@ def main():
             sys.exit(0)
 
     # 2. Connect
-    source_engine = create_engine(source_url)
-    target_engine = create_engine(target_url)
+    source_engine = create_sync_engine(source_url)
+    target_engine = create_sync_engine(target_url)
 
     SourceSession = sessionmaker(bind=source_engine)
     TargetSession = sessionmaker(bind=target_engine)
@@ -245,7 +298,7 @@ def main():
         # 4. Sync Shops
         sync_shops(source_session, target_session, id_map, dry_run=args.dry_run)
 
-        # 5. Sequences
+        # 5. Sequences (commits the shop sync in the same transaction)
         if not args.dry_run:
             update_sequences(target_session)
 
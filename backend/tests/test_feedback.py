@@ -1,18 +1,5 @@
-import os
-import sys
-
-from fastapi.testclient import TestClient
-
-# Add backend directory to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from main import app
-
-client = TestClient(app)
-
-
-def test_create_feedback():
-    response = client.post(
+async def test_create_feedback(aclient):
+    response = await aclient.post(
         "/api/feedback",
         json={
             "name": "Test User",
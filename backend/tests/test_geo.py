@@ -0,0 +1,60 @@
+"""
+Tests for geo distance helpers.
+"""
+
+import pytest
+
+from app.services.geo import distance_from, equirectangular_from, haversine_km
+
+
+class TestHaversine:
+    """Tests for haversine_km"""
+
+    def test_same_point_is_zero(self):
+        assert haversine_km(37.7749, -122.4194, 37.7749, -122.4194) == 0
+
+    def test_sf_to_oakland(self):
+        """Matches the known ~13.4km SF → Oakland distance."""
+        assert haversine_km(37.7749, -122.4194, 37.8044, -122.2712) == pytest.approx(
+            13.43, abs=0.01
+        )
+
+    def test_one_degree_latitude(self):
+        """One degree along a meridian is ~111.19km."""
+        assert haversine_km(0, 0, 1, 0) == pytest.approx(111.19, abs=0.01)
+
+    def test_symmetric(self):
+        there = haversine_km(25.0330, 121.5654, 37.7749, -122.4194)
+        back = haversine_km(37.7749, -122.4194, 25.0330, 121.5654)
+        assert there == pytest.approx(back)
+
+    def test_same_meridian_matches_general_formula(self):
+        """The same-meridian shortcut agrees with the full formula."""
+        nearly_same_meridian = haversine_km(10.0, 20.0, 12.5, 20.0 + 1e-9)
+        assert haversine_km(10.0, 20.0, 12.5, 20.0) == pytest.approx(
+            nearly_same_meridian
+        )
+
+    def test_distance_from_reused_origin(self):
+        """One origin scores several points."""
+        distance_to = distance_from(37.7749, -122.4194)
+        assert distance_to(37.7749, -122.4194) == 0
+        assert distance_to(37.8044, -122.2712) == pytest.approx(13.43, abs=0.01)
+        assert distance_to(38.7749, -122.4194) == pytest.approx(111.19, abs=0.01)
+
+
+class TestEquirectangular:
+    """Tests for equirectangular_from"""
+
+    @pytest.mark.parametrize("lat", [0.0, 25.0330, 37.7749, 60.0])
+    @pytest.mark.parametrize("dlat,dlng", [(0.03, 0.0), (0.0, 0.04), (0.02, -0.03)])
+    def test_matches_haversine_within_meters(self, lat, dlat, dlng):
+        """Within a few km the approximation is off by less than 5 meters."""
+        approx = equirectangular_from(lat, 121.0)(lat + dlat, 121.0 + dlng)
+        exact = haversine_km(lat, 121.0, lat + dlat, 121.0 + dlng)
+        assert approx == pytest.approx(exact, abs=0.005)
+
+    def test_wraps_antimeridian(self):
+        """Points either side of 180° are close, not half the world apart."""
+        distance = equirectangular_from(0.0, 179.99)(0.0, -179.99)
+        assert distance == pytest.approx(2.22, abs=0.01)
@@ -7,7 +7,7 @@ from datetime import datetime
 import pytest
 from sqlalchemy.exc import IntegrityError
 
-from app.models import Brand, Shop
+from app.models import Brand
 
 
 class TestBrandModel:
@@ -33,9 +33,10 @@ class TestBrandModel:
     def test_brand_name_required(self, test_db):
         """Brand requires name field."""
         brand = Brand(description="No name brand")
-        test_db.add(brand)
         with pytest.raises(IntegrityError):
-            test_db.commit()
+            with test_db.begin_nested():
+                test_db.add(brand)
+                test_db.flush()
 
     def test_brand_name_unique(self, test_db):
         """Brand name must be unique."""
@@ -44,9 +45,10 @@ class TestBrandModel:
         test_db.commit()
 
         brand2 = Brand(name="Unique Brand")
-        test_db.add(brand2)
         with pytest.raises(IntegrityError):
-            test_db.commit()
+            with test_db.begin_nested():
+                test_db.add(brand2)
+                test_db.flush()
 
     def test_brand_optional_fields(self, test_db):
         """Brand optional fields can be null."""
@@ -65,18 +67,9 @@ class TestBrandModel:
 class TestShopModel:
     """Tests for the Shop model."""
 
-    def test_shop_creation(self, test_db, sample_brand):
+    def test_shop_creation(self, test_db, shop_factory, sample_brand):
         """Shop model creates with valid data."""
-        shop = Shop(
-            name="Test Shop",
-            brand_id=sample_brand.id,
-            address="123 Test St",
-            city="Test City",
-            country="US",
-            latitude=37.7749,
-            longitude=-122.4194,
-        )
-        test_db.add(shop)
+        shop = shop_factory(brand_id=sample_brand.id, city="Test City")
         test_db.commit()
         test_db.refresh(shop)
 
@@ -84,29 +77,29 @@ class TestShopModel:
         assert shop.name == "Test Shop"
         assert shop.brand_id == sample_brand.id
 
-    def test_shop_brand_relationship(self, test_db, sample_shop, sample_brand):
+    def test_shop_brand_relationship(self, test_db, sample_brand_and_shop):
         """Shop correctly references Brand."""
+        sample_brand, sample_shop = sample_brand_and_shop
         assert sample_shop.brand is not None
         assert sample_shop.brand.id == sample_brand.id
         assert sample_shop.brand.name == sample_brand.name
 
-    def test_brand_shops_relationship(self, test_db, sample_shop, sample_brand):
+    def test_brand_shops_relationship(self, test_db, sample_brand_and_shop):
         """Brand has shops collection."""
-        test_db.refresh(sample_brand)
-        assert len(sample_brand.shops) >= 1
-        assert sample_shop.id in [s.id for s in sample_brand.shops]
+        sample_brand, sample_shop = sample_brand_and_shop
+        brand = test_db.get(Brand, sample_brand.id)
+        assert len(brand.shops) >= 1
+        assert sample_shop.id in [s.id for s in brand.shops]
 
-    def test_shop_without_brand(self, test_db):
+    def test_shop_without_brand(self, test_db, shop_factory):
         """Shop can exist without brand (independent shop)."""
-        shop = Shop(
+        shop = shop_factory(
             name="Independent Shop",
             brand_id=None,
             address="456 Solo Ave",
-            country="US",
             latitude=37.8000,
             longitude=-122.2700,
         )
-        test_db.add(shop)
         test_db.commit()
         test_db.refresh(shop)
 
@@ -114,124 +107,72 @@ class TestShopModel:
         assert shop.brand_id is None
         assert shop.brand is None
 
-    def test_shop_name_required(self, test_db):
+    def test_shop_name_required(self, test_db, shop_factory):
         """Shop requires name field."""
-        shop = Shop(
-            address="123 Test St",
-            country="US",
-            latitude=37.7749,
-            longitude=-122.4194,
-        )
-        test_db.add(shop)
         with pytest.raises(IntegrityError):
-            test_db.commit()
+            with test_db.begin_nested():
+                shop_factory(name=None)
+                test_db.flush()
 
-    def test_shop_address_required(self, test_db):
+    def test_shop_address_required(self, test_db, shop_factory):
         """Shop requires address field."""
-        shop = Shop(
-            name="No Address Shop",
-            country="US",
-            latitude=37.7749,
-            longitude=-122.4194,
-        )
-        test_db.add(shop)
         with pytest.raises(IntegrityError):
-            test_db.commit()
+            with test_db.begin_nested():
+                shop_factory(name="No Address Shop", address=None)
+                test_db.flush()
 
-    def test_shop_country_required(self, test_db):
+    def test_shop_country_required(self, test_db, shop_factory):
         """Shop requires country field."""
-        shop = Shop(
-            name="No Country Shop",
-            address="123 Test St",
-            latitude=37.7749,
-            longitude=-122.4194,
-        )
-        test_db.add(shop)
         with pytest.raises(IntegrityError):
-            test_db.commit()
+            with test_db.begin_nested():
+                shop_factory(name="No Country Shop", country=None)
+                test_db.flush()
 
-    def test_google_place_id_unique(self, test_db, sample_brand):
+    def test_google_place_id_unique(self, test_db, shop_factory, sample_brand):
         """google_place_id must be unique."""
-        shop1 = Shop(
-            name="Shop 1",
-            address="Address 1",
-            country="US",
-            latitude=37.7749,
-            longitude=-122.4194,
-            google_place_id="same_place_id",
+        shop_factory(
+            name="Shop 1", address="Address 1", google_place_id="same_place_id"
         )
-        test_db.add(shop1)
         test_db.commit()
 
-        shop2 = Shop(
-            name="Shop 2",
-            address="Address 2",
-            country="US",
-            latitude=37.8000,
-            longitude=-122.2700,
-            google_place_id="same_place_id",  # Duplicate
-        )
-        test_db.add(shop2)
         with pytest.raises(IntegrityError):
-            test_db.commit()
-
-    def test_google_place_id_nullable(self, test_db):
+            with test_db.begin_nested():
+                shop_factory(
+                    name="Shop 2",
+                    address="Address 2",
+                    latitude=37.8000,
+                    longitude=-122.2700,
+                    google_place_id="same_place_id",  # Duplicate
+                )
+                test_db.flush()
+
+    def test_google_place_id_nullable(self, test_db, shop_factory):
         """google_place_id can be null."""
-        shop = Shop(
-            name="No Place ID Shop",
-            address="123 Test St",
-            country="US",
-            latitude=37.7749,
-            longitude=-122.4194,
-            google_place_id=None,
-        )
-        test_db.add(shop)
+        shop = shop_factory(name="No Place ID Shop", google_place_id=None)
         test_db.commit()
         test_db.refresh(shop)
 
         assert shop.google_place_id is None
 
-    def test_shop_status_default(self, test_db):
+    def test_shop_status_default(self, test_db, shop_factory):
         """Shop status defaults to active."""
-        shop = Shop(
-            name="Default Status Shop",
-            address="123 Test St",
-            country="US",
-            latitude=37.7749,
-            longitude=-122.4194,
-        )
-        test_db.add(shop)
+        shop = shop_factory(name="Default Status Shop")
         test_db.commit()
         test_db.refresh(shop)
 
         assert shop.status == "active"
 
-    def test_shop_status_values(self, test_db):
+    def test_shop_status_values(self, test_db, shop_factory):
         """Shop status accepts valid values."""
         for status in ["active", "closed", "unverified"]:
-            shop = Shop(
-                name=f"Shop {status}",
-                address="123 Test St",
-                country="US",
-                latitude=37.7749,
-                longitude=-122.4194,
-                status=status,
-            )
-            test_db.add(shop)
+            shop = shop_factory(name=f"Shop {status}", status=status)
             test_db.commit()
             test_db.refresh(shop)
             assert shop.status == status
 
-    def test_timestamps_auto_set(self, test_db):
+    def test_timestamps_auto_set(self, test_db, shop_factory):
         """created_at and updated_at auto-populate."""
-        shop = Shop(
-            name="Timestamp Shop",
-            address="123 Test St",
-            country="US",
-            latitude=37.7749,
-            longitude=-122.4194,
-        )
-        test_db.add(shop)
+        shop = shop_factory(name="Timestamp Shop")
         test_db.commit()
         test_db.refresh(shop)
 
@@ -2,6 +2,30 @@
 Tests for the Shops API endpoints.
 """
 
+import base64
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import delete, event, text
+
+from app.models import Shop
+
+
+@contextmanager
+def count_selects(engine):
+    """Count SELECT statements executed on engine inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
 
 class TestListShops:
     """Tests for GET /api/shops"""
@@ -41,6 +65,86 @@ class TestListShops:
         assert len(data["shops"]) == 2
         assert data["page"] == 2
 
+    def test_list_shops_page_past_end_keeps_total(self, client, sample_shops):
+        """A page past the end is empty but still reports the total."""
+        response = client.get("/api/shops", params={"page": 3, "page_size": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["shops"] == []
+        assert data["total"] == 4
+
+    def test_list_shops_without_total(self, client, sample_shops):
+        """include_total=false skips the count but still pages."""
+        response = client.get(
+            "/api/shops", params={"page_size": 2, "include_total": "false"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["shops"]) == 2
+        assert data["total"] is None
+        assert data["next_cursor"] is not None
+
+    def test_list_shops_large_page_streams_same_body(self, client, sample_shops):
+        """Streamed large pages decode to the same body as a small page."""
+        small = client.get("/api/shops", params={"page_size": 20}).json()
+        response = client.get("/api/shops", params={"page_size": 500})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["shops"] == small["shops"]
+        assert data["total"] == 4
+        assert data["page_size"] == 500
+        assert data["next_cursor"] is None
+
+    def test_list_shops_cursor_follows_next_cursor(self, client, sample_shops):
+        """Following next_cursor returns the next page without a total."""
+        first = client.get("/api/shops", params={"page_size": 2}).json()
+        assert first["next_cursor"] is not None
+
+        response = client.get(
+            "/api/shops", params={"cursor": first["next_cursor"], "page_size": 2}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["shops"]) == 2
+        assert data["total"] is None
+        first_ids = {shop["id"] for shop in first["shops"]}
+        assert first_ids.isdisjoint(shop["id"] for shop in data["shops"])
+        assert min(shop["id"] for shop in data["shops"]) > max(first_ids)
+
+    def test_list_shops_cursor_last_page(self, client, sample_shops):
+        """A short page has no next_cursor."""
+        first = client.get("/api/shops", params={"page_size": 3}).json()
+        response = client.get(
+            "/api/shops", params={"cursor": first["next_cursor"], "page_size": 3}
+        )
+        data = response.json()
+        assert len(data["shops"]) == 1
+        assert data["next_cursor"] is None
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            base64.urlsafe_b64encode(b"99999999999999999999").decode(),
+            base64.urlsafe_b64encode(b"-1").decode(),
+        ],
+    )
+    def test_list_shops_invalid_cursor(self, client, cursor):
+        """Rejects a cursor that does not decode to an in-range id."""
+        response = client.get("/api/shops", params={"cursor": cursor})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_list_shops_loads_brands_in_one_query(
+        self, client, sample_shops, test_engine
+    ):
+        """Brands are joined into the page query instead of lazy-loaded."""
+        with count_selects(test_engine) as selects:
+            response = client.get("/api/shops")
+        assert response.status_code == 200
+        assert all(shop["brand"] is not None for shop in response.json()["shops"])
+        assert len(selects) == 1
+
     def test_list_shops_filter_country_us(self, client, sample_shops):
         """Filter by country returns only US shops."""
         response = client.get("/api/shops", params={"country": "US"})
@@ -77,6 +181,45 @@ class TestListShops:
         for shop in data["shops"]:
             assert shop["brand_id"] == brand_id
 
+    @pytest.mark.parametrize(
+        "column,index_name",
+        [
+            ("country", "ix_shops_country"),
+            ("city", "ix_shops_city"),
+            ("brand_id", "ix_shops_brand_id"),
+        ],
+    )
+    def test_list_shops_filters_use_index(self, test_db, column, index_name):
+        """Each list filter is an index lookup, not a table scan."""
+        plan = test_db.execute(
+            text(f"EXPLAIN QUERY PLAN SELECT id FROM shops WHERE {column} = :value"),
+            {"value": "US" if column != "brand_id" else 1},
+        ).all()
+        assert any(index_name in row.detail for row in plan)
+
+    def test_list_shops_cached_until_create(self, client, test_engine):
+        """Repeated lists are served from cache and a POST invalidates them."""
+        assert client.get("/api/shops").json()["total"] == 0
+
+        with count_selects(test_engine) as selects:
+            assert client.get("/api/shops").json()["total"] == 0
+        assert selects == []
+
+        shop_data = {
+            "name": "Cache Buster",
+            "address": "1 Cache St, San Francisco, CA",
+            "country": "US",
+            "latitude": 37.78,
+            "longitude": -122.41,
+        }
+        assert client.post("/api/shops", json=shop_data).status_code == 201
+
+        with count_selects(test_engine) as selects:
+            data = client.get("/api/shops").json()
+        assert len(selects) >= 1
+        assert data["total"] == 1
+        assert data["shops"][0]["name"] == "Cache Buster"
+
 
 class TestSearchShops:
     """Tests for GET /api/shops/search"""
@@ -110,6 +253,13 @@ class TestSearchShops:
         shops = response.json()
         assert shops == []
 
+    def test_search_shops_wildcards_are_literal(self, client, sample_shops):
+        """LIKE wildcards in the query match literally, not every shop."""
+        for q in ("%", "_"):
+            response = client.get("/api/shops/search", params={"q": q})
+            assert response.status_code == 200
+            assert response.json() == []
+
     def test_search_shops_with_limit(self, client, sample_shops):
         """Search respects limit parameter."""
         response = client.get("/api/shops/search", params={"q": "a", "limit": 2})
@@ -151,6 +301,55 @@ class TestNearbyShops:
         for shop in shops:
             assert shop["city"] in ["San Francisco"]
 
+    def test_nearby_shops_excludes_bounding_box_corners(self, client, sample_shops):
+        """Shops inside the bounding box but beyond the radius are dropped."""
+        # Oakland is ~13.4km from SF but inside the 13.3km bounding box
+        response = client.get(
+            "/api/shops/nearby",
+            params={"lat": 37.7749, "lng": -122.4194, "radius_km": 13.3},
+        )
+        assert response.status_code == 200
+        shops = response.json()
+        assert [shop["city"] for shop in shops] == ["San Francisco", "San Francisco"]
+
+    def test_nearby_shops_sorted_by_distance(self, client, sample_shops):
+        """Nearest shops come first."""
+        # Anchored on Tiger Sugar SF
+        response = client.get(
+            "/api/shops/nearby",
+            params={"lat": 37.7855, "lng": -122.4079, "radius_km": 20},
+        )
+        names = [shop["name"] for shop in response.json()]
+        assert names == ["Tiger Sugar SF", "Gong Cha SF Downtown", "Boba Guys Oakland"]
+
+    def test_nearby_shops_skips_shop_deleted_mid_request(
+        self, client, sample_shops, test_session_factory
+    ):
+        """A shop deleted between the distance pass and the row load is dropped."""
+        deleted_id = sample_shops[1].id  # Tiger Sugar SF
+        selects = []
+
+        def delete_before_row_load(orm_execute_state):
+            if not orm_execute_state.is_select:
+                return
+            selects.append(orm_execute_state.statement)
+            if len(selects) == 2:
+                orm_execute_state.session.execute(
+                    delete(Shop).where(Shop.id == deleted_id)
+                )
+
+        event.listen(test_session_factory, "do_orm_execute", delete_before_row_load)
+        try:
+            response = client.get(
+                "/api/shops/nearby",
+                params={"lat": 37.7749, "lng": -122.4194, "radius_km": 10},
+            )
+        finally:
+            event.remove(test_session_factory, "do_orm_execute", delete_before_row_load)
+
+        assert response.status_code == 200
+        assert [shop["name"] for shop in response.json()] == ["Gong Cha SF Downtown"]
+
     def test_nearby_shops_empty_area(self, client, sample_shops):
         """Returns empty list when no shops nearby."""
         # Middle of Pacific Ocean
@@ -197,6 +396,22 @@ class TestNearbyShops:
         )
         assert response.status_code == 422
 
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"lat": -90, "lng": 0, "radius_km": 5},
+            {"lat": 90, "lng": 0, "radius_km": 5},
+            {"lat": 0, "lng": -180, "radius_km": 5},
+            {"lat": 0, "lng": 180, "radius_km": 5},
+            {"lat": 0, "lng": 0, "radius_km": 0.1},
+            {"lat": 0, "lng": 0, "radius_km": 50},
+        ],
+    )
+    def test_nearby_shops_accepts_bounds(self, client, params):
+        """Range limits are inclusive."""
+        response = client.get("/api/shops/nearby", params=params)
+        assert response.status_code == 200
+
     def test_nearby_shops_radius_validation_max(self, client):
         """Validates radius maximum value."""
         response = client.get(
@@ -218,14 +433,25 @@ class TestGetShop:
         assert data["name"] == sample_shop.name
         assert data["address"] == sample_shop.address
 
-    def test_get_shop_includes_brand(self, client, sample_shop, sample_brand):
+    def test_get_shop_includes_brand(self, client, sample_brand_and_shop):
         """Returns shop with brand information."""
+        sample_brand, sample_shop = sample_brand_and_shop
         response = client.get(f"/api/shops/{sample_shop.id}")
         assert response.status_code == 200
         data = response.json()
         assert data["brand"] is not None
         assert data["brand"]["name"] == sample_brand.name
 
+    def test_get_shop_loads_brand_in_one_query(
+        self, client, sample_brand_and_shop, test_engine
+    ):
+        """The shop and its brand come back from a single query."""
+        _, sample_shop = sample_brand_and_shop
+        with count_selects(test_engine) as selects:
+            response = client.get(f"/api/shops/{sample_shop.id}")
+        assert response.json()["brand"] is not None
+        assert len(selects) == 1
+
     def test_get_shop_not_found(self, client):
         """Returns 404 when shop doesn't exist."""
         response = client.get("/api/shops/99999")
@@ -299,3 +525,9 @@ class TestCreateShop:
         assert data["rating"] == 4.8
         assert data["phone"] == "+1-555-123-4567"
         assert data["google_place_id"] == "unique_place_id_123"
+
+    def test_created_shops_do_not_leak(self, client):
+        """Shops created by earlier tests were rolled back with their test."""
+        response = client.get("/api/shops")
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
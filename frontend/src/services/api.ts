@@ -15,6 +15,8 @@ export async function getShops(params?: {
   country?: string;
   city?: string;
   brand_id?: number;
+  cursor?: string;
+  include_total?: boolean;
 }): Promise<ShopListResponse> {
   const response = await api.get('/api/shops', { params });
   return response.data;
@@ -28,9 +28,10 @@ export interface Shop {
 
 export interface ShopListResponse {
   shops: Shop[];
-  total: number;
+  total: number | null;
   page: number;
   page_size: number;
+  next_cursor?: string | null;
 }
 
 export interface FeedbackCreate {